@@ -15,12 +15,21 @@ Hook Types:
     - agent:   Full agent LLM call, cost = full conversation tokens
 """
 
-import json
 import sys
 import os
+import mmap
+import pickle
+import heapq
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+try:
+    import orjson
+except ImportError:
+    import json as orjson
 
 # ANSI colors
 CYAN = '\033[0;36m'
@@ -33,43 +42,58 @@ DIM = '\033[2m'
 BOLD = '\033[1m'
 NC = '\033[0m'
 
+# Plain output when piped or redirected
+if not sys.stdout.isatty():
+    CYAN = GREEN = YELLOW = RED = BLUE = MAGENTA = DIM = BOLD = NC = ''
+
 # Hook Lab paths
 HOOK_LAB = Path('/home/corey/hook-lab')
 CLAUDE_PROJECTS = Path.home() / '.claude' / 'projects'
 HOOK_LAB_PROJECT = CLAUDE_PROJECTS / '-home-corey-hook-lab'
 
+# Sessions smaller than this are read in one call; larger ones are memory-mapped
+WHOLE_FILE_MAX_BYTES = 100 * 1024 * 1024
+
+# Bump when the shape of parse_session() results changes
+PARSE_CACHE_VERSION = 3
+
+# Pricing per token (as of 2024): (input, output, cache_read, cache_create)
+OPUS = (15e-6, 75e-6, 1.5e-6, 18.75e-6)
+SONNET = (3e-6, 15e-6, 0.3e-6, 3.75e-6)
+HAIKU = (0.25e-6, 1.25e-6, 0.025e-6, 0.3125e-6)
+PRICING = {'opus': OPUS, 'sonnet': SONNET, 'haiku': HAIKU}
+
 
-def get_hook_lab_sessions() -> list:
-    """Get all hook-lab sessions sorted by modification time."""
+def get_hook_lab_sessions(limit: int = None) -> list:
+    """Get hook-lab sessions sorted by modification time (newest first).
+
+    If limit is given, only the newest `limit` sessions are returned.
+    """
     if not HOOK_LAB_PROJECT.exists():
         return []
 
     sessions = []
-    for f in HOOK_LAB_PROJECT.glob('*.jsonl'):
-        sessions.append({
-            'id': f.stem,
-            'path': f,
-            'mtime': f.stat().st_mtime,
-            'modified': datetime.fromtimestamp(f.stat().st_mtime)
-        })
-
+    with os.scandir(HOOK_LAB_PROJECT) as it:
+        for f in it:
+            if not f.name.endswith('.jsonl'):
+                continue
+            sessions.append({
+                'id': f.name[:-6],
+                'path': Path(f.path),
+                'mtime': f.stat().st_mtime,
+            })
+
+    if limit is not None:
+        return heapq.nlargest(limit, sessions, key=lambda x: x['mtime'])
     return sorted(sessions, key=lambda x: x['mtime'], reverse=True)
 
 
-def parse_session(session_path: Path) -> dict:
-    """Parse a session file and categorize API calls."""
-    entries = []
-    with open(session_path) as f:
-        for line in f:
-            try:
-                entries.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-
-    result = {
+def _new_result(session_path: Path) -> dict:
+    """Build the empty result structure for a session."""
+    return {
         'session_id': session_path.stem,
         'file_path': str(session_path),
-        'entry_count': len(entries),
+        'entry_count': 0,
 
         # Separate by source
         'main_agent': {
@@ -93,54 +117,77 @@ def parse_session(session_path: Path) -> dict:
         'additional_context': [],
     }
 
-    seen_request_ids = {}  # Track max tokens per request
-
-    for entry in entries:
-        entry_type = entry.get('type')
-
-        # Track user prompts
-        if entry_type == 'user':
-            msg = entry.get('message', {})
-            if isinstance(msg, dict):
-                content = msg.get('content', '')
-                if isinstance(content, str) and content:
-                    result['user_prompts'].append({
-                        'content': content[:200],
-                        'timestamp': entry.get('timestamp'),
-                    })
-
-        # Track assistant messages with usage
-        if entry_type == 'assistant':
-            msg = entry.get('message', {})
-            request_id = entry.get('requestId', '')
-            model = msg.get('model', 'unknown')
-            usage = msg.get('usage', {})
-
-            if usage and request_id:
-                # Track per-request (take max values due to streaming)
-                current = seen_request_ids.get(request_id, {
-                    'model': model,
-                    'input_tokens': 0,
-                    'output_tokens': 0,
-                    'cache_creation': 0,
-                    'cache_read': 0,
-                })
-
-                current['input_tokens'] = max(current['input_tokens'], usage.get('input_tokens', 0))
-                current['output_tokens'] = max(current['output_tokens'], usage.get('output_tokens', 0))
-                current['cache_creation'] = max(current['cache_creation'], usage.get('cache_creation_input_tokens', 0))
-                current['cache_read'] = max(current['cache_read'], usage.get('cache_read_input_tokens', 0))
-
-                seen_request_ids[request_id] = current
-
-            # Track tool uses
-            content = msg.get('content', [])
-            if isinstance(content, list):
-                for item in content:
-                    if isinstance(item, dict) and item.get('type') == 'tool_use':
-                        result['tool_uses'].append(item.get('name', 'unknown'))
-
-    # Categorize API calls
+
+def _iter_session_lines(session_path: Path):
+    """Yield the raw byte lines of a session file."""
+    if session_path.stat().st_size < WHOLE_FILE_MAX_BYTES:
+        # One read + one split instead of a buffered readline per line
+        yield from session_path.read_bytes().splitlines()
+        return
+
+    with open(session_path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            # Pages are faulted in on demand; no per-read copy through io buffers
+            yield from iter(mm.readline, b'')
+        finally:
+            mm.close()
+
+
+def _handle_user(entry: dict, result: dict, seen_request_ids: dict):
+    """Track user prompts."""
+    msg = entry.get('message', {})
+    if type(msg) is dict:
+        content = msg.get('content', '')
+        if isinstance(content, str) and content:
+            result['user_prompts'].append({
+                'content': content[:60],
+                'timestamp': entry.get('timestamp'),
+            })
+
+
+def _handle_assistant(entry: dict, result: dict, seen_request_ids: dict):
+    """Track assistant messages with usage."""
+    msg = entry.get('message', {})
+    request_id = entry.get('requestId', '')
+    model = msg.get('model', 'unknown')
+    usage = msg.get('usage', {})
+
+    if usage and request_id:
+        # Track per-request (take max values due to streaming)
+        current = seen_request_ids[request_id]
+        if current['model'] is None:
+            current['model'] = model
+
+        usage_get = usage.get
+        current['input_tokens'] = max(current['input_tokens'], usage_get('input_tokens', 0))
+        current['output_tokens'] = max(current['output_tokens'], usage_get('output_tokens', 0))
+        current['cache_creation'] = max(current['cache_creation'], usage_get('cache_creation_input_tokens', 0))
+        current['cache_read'] = max(current['cache_read'], usage_get('cache_read_input_tokens', 0))
+
+    # Track tool uses
+    content = msg.get('content', [])
+    if type(content) is list:
+        tool_uses_append = result['tool_uses'].append
+        for item in content:
+            if type(item) is dict and item.get('type') == 'tool_use':
+                tool_uses_append(item.get('name', 'unknown'))
+
+
+# Entry type -> handler; entries of any other type are counted but ignored
+HANDLERS = {
+    'user': _handle_user,
+    'assistant': _handle_assistant,
+}
+
+
+def _categorize_requests(result: dict, seen_request_ids: dict):
+    """Attribute each de-duplicated API request to the main agent or a hook."""
+    hooks_prompt = result['hooks']['prompt']
+    main = result['main_agent']
+    main_models = main['models']
+    by_model = result['api_calls_by_model']
+
     for req_id, data in seen_request_ids.items():
         model = data['model']
 
@@ -148,68 +195,122 @@ def parse_session(session_path: Path) -> dict:
         # This is imperfect - we need more data to refine
         is_hook = 'haiku' in model.lower()
 
-        result['api_calls_by_model'][model].append(data)
+        by_model[model].append(data)
 
         if is_hook:
             # Likely a prompt hook
-            result['hooks']['prompt']['count'] += 1
-            result['hooks']['prompt']['input_tokens'] += data['input_tokens'] + data['cache_read']
-            result['hooks']['prompt']['output_tokens'] += data['output_tokens']
+            hooks_prompt['count'] += 1
+            hooks_prompt['input_tokens'] += data['input_tokens'] + data['cache_read']
+            hooks_prompt['output_tokens'] += data['output_tokens']
         else:
             # Main agent (or agent hook - need more heuristics)
-            result['main_agent']['api_calls'] += 1
-            result['main_agent']['input_tokens'] += data['input_tokens']
-            result['main_agent']['output_tokens'] += data['output_tokens']
-            result['main_agent']['cache_creation'] += data['cache_creation']
-            result['main_agent']['cache_read'] += data['cache_read']
-            result['main_agent']['models'][model] += 1
+            main['api_calls'] += 1
+            main['input_tokens'] += data['input_tokens']
+            main['output_tokens'] += data['output_tokens']
+            main['cache_creation'] += data['cache_creation']
+            main['cache_read'] += data['cache_read']
+            main_models[model] += 1
+
+
+def parse_session(session_path: Path) -> dict:
+    """Parse a session file and categorize API calls."""
+    result = _new_result(session_path)
+    handlers_get = HANDLERS.get
+
+    # Track max tokens per request
+    seen_request_ids = defaultdict(lambda: {
+        'model': None,
+        'input_tokens': 0,
+        'output_tokens': 0,
+        'cache_creation': 0,
+        'cache_read': 0,
+    })
+    entry_count = 0
+
+    # Single pass: each entry is consumed as soon as it is decoded
+    for line in _iter_session_lines(session_path):
+        # Only user/assistant entries are inspected; a line that does not mention
+        # either type value cannot be one, so skip decoding it entirely
+        if b'"user"' not in line and b'"assistant"' not in line:
+            if line and not line.isspace():
+                entry_count += 1
+            continue
+
+        try:
+            entry = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            continue
+        entry_count += 1
+        handler = handlers_get(entry.get('type'))
+        if handler is not None:
+            handler(entry, result, seen_request_ids)
+
+    result['entry_count'] = entry_count
+    _categorize_requests(result, seen_request_ids)
 
     return result
 
 
-def calculate_cost(tokens: dict, model: str = 'opus') -> float:
-    """Calculate cost based on model pricing."""
-    # Pricing per 1M tokens (as of 2024)
-    pricing = {
-        'opus': {'input': 15.0, 'output': 75.0, 'cache_read': 1.50, 'cache_create': 18.75},
-        'sonnet': {'input': 3.0, 'output': 15.0, 'cache_read': 0.30, 'cache_create': 3.75},
-        'haiku': {'input': 0.25, 'output': 1.25, 'cache_read': 0.025, 'cache_create': 0.3125},
-    }
+def load_session(session_path: Path) -> dict:
+    """Parse a session, reusing the cached result if the file is unchanged."""
+    cache_path = session_path.with_name(session_path.name + '.parsed.pkl')
+    st = session_path.stat()
+    key = (PARSE_CACHE_VERSION, st.st_mtime, st.st_size)
 
-    p = pricing.get(model, pricing['opus'])
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        if cached['key'] == key:
+            return cached['data']
+    except Exception:
+        pass  # Missing or corrupt cache; fall through to a fresh parse
 
-    cost = 0
-    cost += tokens.get('input_tokens', 0) * p['input'] / 1_000_000
-    cost += tokens.get('output_tokens', 0) * p['output'] / 1_000_000
-    cost += tokens.get('cache_read', 0) * p['cache_read'] / 1_000_000
-    cost += tokens.get('cache_creation', 0) * p['cache_create'] / 1_000_000
+    data = parse_session(session_path)
 
-    return cost
+    try:
+        with open(cache_path, 'wb') as f:
+            pickle.dump({'key': key, 'data': data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # Cache is best-effort; read-only project dirs just re-parse
+
+    return data
+
+
+def calculate_cost(tokens: dict, model: str = 'opus') -> float:
+    """Calculate cost based on model pricing."""
+    input_rate, output_rate, cache_read_rate, cache_create_rate = PRICING.get(model, OPUS)
+
+    return (tokens.get('input_tokens', 0) * input_rate
+            + tokens.get('output_tokens', 0) * output_rate
+            + tokens.get('cache_read', 0) * cache_read_rate
+            + tokens.get('cache_creation', 0) * cache_create_rate)
 
 
 def print_session_analysis(data: dict):
     """Print detailed hook cost analysis."""
-    print(f"\n{CYAN}{'═' * 65}{NC}")
-    print(f"{CYAN}  Hook Lab Session Analysis{NC}")
-    print(f"{CYAN}{'═' * 65}{NC}")
+    lines = []
 
-    print(f"\n{YELLOW}Session:{NC} {data['session_id']}")
-    print(f"{DIM}{data['file_path']}{NC}")
+    lines.append(f"\n{CYAN}{'═' * 65}{NC}")
+    lines.append(f"{CYAN}  Hook Lab Session Analysis{NC}")
+    lines.append(f"{CYAN}{'═' * 65}{NC}")
+
+    lines.append(f"\n{YELLOW}Session:{NC} {data['session_id']}")
+    lines.append(f"{DIM}{data['file_path']}{NC}")
 
     # Overview
-    print(f"\n{YELLOW}Overview:{NC}")
-    print(f"  Total entries:    {data['entry_count']}")
-    print(f"  User prompts:     {len(data['user_prompts'])}")
-    print(f"  Tool uses:        {len(data['tool_uses'])}")
+    lines.append(f"\n{YELLOW}Overview:{NC}")
+    lines.append(f"  Total entries:    {data['entry_count']}")
+    lines.append(f"  User prompts:     {len(data['user_prompts'])}")
+    lines.append(f"  Tool uses:        {len(data['tool_uses'])}")
 
     # Main Agent costs
     main = data['main_agent']
-    print(f"\n{YELLOW}Main Agent (Opus):{NC}")
-    print(f"  API calls:        {main['api_calls']}")
-    print(f"  Input tokens:     {main['input_tokens']:,}")
-    print(f"  Output tokens:    {main['output_tokens']:,}")
-    print(f"  Cache creation:   {main['cache_creation']:,}")
-    print(f"  Cache read:       {main['cache_read']:,}")
+    lines.append(f"\n{YELLOW}Main Agent (Opus):{NC}")
+    lines.append(f"  API calls:        {main['api_calls']}")
+    lines.append(f"  Input tokens:     {main['input_tokens']:,}")
+    lines.append(f"  Output tokens:    {main['output_tokens']:,}")
+    lines.append(f"  Cache creation:   {main['cache_creation']:,}")
+    lines.append(f"  Cache read:       {main['cache_read']:,}")
 
     main_cost = calculate_cost({
         'input_tokens': main['input_tokens'],
@@ -217,78 +318,82 @@ def print_session_analysis(data: dict):
         'cache_creation': main['cache_creation'],
         'cache_read': main['cache_read'],
     }, 'opus')
-    print(f"  {GREEN}Estimated cost:   ${main_cost:.4f}{NC}")
+    lines.append(f"  {GREEN}Estimated cost:   ${main_cost:.4f}{NC}")
 
     # Hook costs
     hooks = data['hooks']
-    print(f"\n{YELLOW}Hook Costs:{NC}")
+    lines.append(f"\n{YELLOW}Hook Costs:{NC}")
 
     # Command hooks
     cmd = hooks['command']
-    print(f"\n  {BLUE}Command hooks:{NC}")
-    print(f"    Count:          {cmd['count']}")
-    print(f"    Context tokens: {cmd['context_tokens']}")
-    print(f"    {DIM}(Command hooks are FREE unless they inject context){NC}")
+    lines.append(f"\n  {BLUE}Command hooks:{NC}")
+    lines.append(f"    Count:          {cmd['count']}")
+    lines.append(f"    Context tokens: {cmd['context_tokens']}")
+    lines.append(f"    {DIM}(Command hooks are FREE unless they inject context){NC}")
 
     # Prompt hooks
     prompt = hooks['prompt']
-    print(f"\n  {MAGENTA}Prompt hooks (Haiku):{NC}")
-    print(f"    Count:          {prompt['count']}")
-    print(f"    Input tokens:   {prompt['input_tokens']:,}")
-    print(f"    Output tokens:  {prompt['output_tokens']:,}")
+    lines.append(f"\n  {MAGENTA}Prompt hooks (Haiku):{NC}")
+    lines.append(f"    Count:          {prompt['count']}")
+    lines.append(f"    Input tokens:   {prompt['input_tokens']:,}")
+    lines.append(f"    Output tokens:  {prompt['output_tokens']:,}")
     prompt_cost = calculate_cost({
         'input_tokens': prompt['input_tokens'],
         'output_tokens': prompt['output_tokens'],
     }, 'haiku')
-    print(f"    {GREEN}Estimated cost: ${prompt_cost:.6f}{NC}")
+    lines.append(f"    {GREEN}Estimated cost: ${prompt_cost:.6f}{NC}")
 
     # Agent hooks
     agent = hooks['agent']
-    print(f"\n  {RED}Agent hooks:{NC}")
-    print(f"    Count:          {agent['count']}")
-    print(f"    Input tokens:   {agent['input_tokens']:,}")
-    print(f"    Output tokens:  {agent['output_tokens']:,}")
+    lines.append(f"\n  {RED}Agent hooks:{NC}")
+    lines.append(f"    Count:          {agent['count']}")
+    lines.append(f"    Input tokens:   {agent['input_tokens']:,}")
+    lines.append(f"    Output tokens:  {agent['output_tokens']:,}")
     agent_cost = calculate_cost({
         'input_tokens': agent['input_tokens'],
         'output_tokens': agent['output_tokens'],
     }, 'haiku')  # Default to haiku for agent hooks
-    print(f"    {GREEN}Estimated cost: ${agent_cost:.6f}{NC}")
+    lines.append(f"    {GREEN}Estimated cost: ${agent_cost:.6f}{NC}")
 
     # API calls by model
-    print(f"\n{YELLOW}API Calls by Model:{NC}")
+    lines.append(f"\n{YELLOW}API Calls by Model:{NC}")
     for model, calls in data['api_calls_by_model'].items():
         total_in = sum(c['input_tokens'] + c['cache_read'] for c in calls)
         total_out = sum(c['output_tokens'] for c in calls)
-        print(f"  {model}:")
-        print(f"    Calls: {len(calls)}, Input: {total_in:,}, Output: {total_out:,}")
+        lines.append(f"  {model}:")
+        lines.append(f"    Calls: {len(calls)}, Input: {total_in:,}, Output: {total_out:,}")
 
     # User prompts
     if data['user_prompts']:
-        print(f"\n{YELLOW}User Prompts:{NC}")
-        for i, p in enumerate(data['user_prompts'][:5], 1):
+        lines.append(f"\n{YELLOW}User Prompts:{NC}")
+        for i, p in enumerate(islice(data['user_prompts'], 5), 1):
             text = p['content'][:60].replace('\n', ' ')
-            print(f"  {i}. {DIM}{text}...{NC}")
+            lines.append(f"  {i}. {DIM}{text}...{NC}")
 
     # Summary
     total_cost = main_cost + prompt_cost + agent_cost
-    print(f"\n{CYAN}{'─' * 65}{NC}")
-    print(f"{BOLD}Total Session Cost: ${total_cost:.4f}{NC}")
-    print(f"  Main agent: ${main_cost:.4f}")
-    print(f"  Hooks:      ${prompt_cost + agent_cost:.6f}")
-    print()
+    lines.append(f"\n{CYAN}{'─' * 65}{NC}")
+    lines.append(f"{BOLD}Total Session Cost: ${total_cost:.4f}{NC}")
+    lines.append(f"  Main agent: ${main_cost:.4f}")
+    lines.append(f"  Hooks:      ${prompt_cost + agent_cost:.6f}")
+    lines.append('')
+
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def compare_sessions(baseline: dict, test: dict):
     """Compare baseline (no hooks) vs test (with hooks) session."""
-    print(f"\n{CYAN}{'═' * 65}{NC}")
-    print(f"{CYAN}  Hook Cost Comparison{NC}")
-    print(f"{CYAN}{'═' * 65}{NC}")
+    lines = []
+
+    lines.append(f"\n{CYAN}{'═' * 65}{NC}")
+    lines.append(f"{CYAN}  Hook Cost Comparison{NC}")
+    lines.append(f"{CYAN}{'═' * 65}{NC}")
 
-    print(f"\n{YELLOW}Baseline:{NC} {baseline['session_id']}")
-    print(f"{YELLOW}Test:    {NC} {test['session_id']}")
+    lines.append(f"\n{YELLOW}Baseline:{NC} {baseline['session_id']}")
+    lines.append(f"{YELLOW}Test:    {NC} {test['session_id']}")
 
-    print(f"\n{YELLOW}{'Metric':<30} {'Baseline':>12} {'Test':>12} {'Diff':>12}{NC}")
-    print("─" * 68)
+    lines.append(f"\n{YELLOW}{'Metric':<30} {'Baseline':>12} {'Test':>12} {'Diff':>12}{NC}")
+    lines.append("─" * 68)
 
     comparisons = [
         ('User prompts', len(baseline['user_prompts']), len(test['user_prompts'])),
@@ -305,12 +410,13 @@ def compare_sessions(baseline: dict, test: dict):
     for label, base_val, test_val in comparisons:
         diff = test_val - base_val
         if diff > 0:
-            diff_str = f"{GREEN}+{diff:,}{NC}"
+            diff_str = f"{GREEN}{f'+{diff:,}':>12}{NC}"
         elif diff < 0:
-            diff_str = f"{RED}{diff:,}{NC}"
+            diff_str = f"{RED}{diff:>12,}{NC}"
         else:
-            diff_str = f"{DIM}0{NC}"
-        print(f"  {label:<28} {base_val:>12,} {test_val:>12,} {diff_str:>20}")
+            diff_str = f"{DIM}{0:>12}{NC}"
+        # Pad before colouring so alignment doesn't depend on escape codes
+        lines.append(f"  {label:<28} {base_val:>12,} {test_val:>12,} {diff_str}")
 
     # Cost comparison
     base_cost = calculate_cost(baseline['main_agent'], 'opus')
@@ -320,12 +426,14 @@ def compare_sessions(baseline: dict, test: dict):
         'output_tokens': test['hooks']['prompt']['output_tokens'],
     }, 'haiku')
 
-    print(f"\n{YELLOW}Cost Analysis:{NC}")
-    print(f"  Baseline cost:     ${base_cost:.4f}")
-    print(f"  Test cost (main):  ${test_cost:.4f}")
-    print(f"  Hook cost:         ${hook_cost:.6f}")
-    print(f"  {BOLD}Overhead:           ${test_cost - base_cost + hook_cost:.4f}{NC}")
-    print()
+    lines.append(f"\n{YELLOW}Cost Analysis:{NC}")
+    lines.append(f"  Baseline cost:     ${base_cost:.4f}")
+    lines.append(f"  Test cost (main):  ${test_cost:.4f}")
+    lines.append(f"  Hook cost:         ${hook_cost:.6f}")
+    lines.append(f"  {BOLD}Overhead:           ${test_cost - base_cost + hook_cost:.4f}{NC}")
+    lines.append('')
+
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def list_sessions():
@@ -341,7 +449,7 @@ def list_sessions():
 
     for s in sessions:
         print(f"  {s['id']}")
-        print(f"    {DIM}Modified: {s['modified']:%Y-%m-%d %H:%M:%S}{NC}")
+        print(f"    {DIM}Modified: {datetime.fromtimestamp(s['mtime']):%Y-%m-%d %H:%M:%S}{NC}")
     print()
 
 
@@ -350,11 +458,11 @@ def main():
 
     if not args:
         # Analyze latest session
-        sessions = get_hook_lab_sessions()
+        sessions = get_hook_lab_sessions(limit=1)
         if not sessions:
             print(f"{RED}No hook-lab sessions found{NC}")
             sys.exit(1)
-        data = parse_session(sessions[0]['path'])
+        data = load_session(sessions[0]['path'])
         print_session_analysis(data)
 
     elif args[0] in ['-h', '--help']:
@@ -378,8 +486,9 @@ def main():
             print(f"{RED}Test session not found: {args[2]}{NC}")
             sys.exit(1)
 
-        baseline = parse_session(base_path)
-        test = parse_session(test_path)
+        # Both sessions are independent and CPU-bound to decode
+        with ProcessPoolExecutor(max_workers=2) as ex:
+            baseline, test = ex.map(load_session, [base_path, test_path])
         compare_sessions(baseline, test)
 
     else:
@@ -392,7 +501,7 @@ def main():
             print(f"Use --list to see available sessions")
             sys.exit(1)
 
-        data = parse_session(session_path)
+        data = load_session(session_path)
         print_session_analysis(data)
 
 